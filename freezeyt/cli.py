@@ -3,11 +3,34 @@ import shutil
 
 import click
 import yaml
+try:
+    # Use LibYAML's C parser if it's available; it is much faster
+    # than the pure-Python one, especially for large config files.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 from freezeyt import freeze, MultiError
 from freezeyt.util import import_variable_from_module
 
 
+def starts_with_non_mapping(yaml_text):
+    """Cheaply detect YAML documents whose root is clearly not a mapping.
+
+    Looks at the first content line, skipping blank lines, comments,
+    directives and document markers. Only unambiguous sequence roots
+    are reported; anything else is left for the parser to decide.
+    """
+    for line in yaml_text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#%':
+            continue
+        if stripped == '---':
+            continue
+        return stripped == '-' or stripped.startswith(('- ', '['))
+    return False
+
+
 @click.command()
 @click.argument('module_name')
 @click.argument('dest_path', required=False)
@@ -27,10 +50,14 @@ from freezeyt.util import import_variable_from_module
 @click.option('--cleanup/--no-cleanup', 'cleanup',
               default=None,
               help='Remove incomplete directory (if error occured). Default is to clean up.')
+@click.option('--daemon', 'daemon', is_flag=True,
+              help='Keep running after the freeze and re-freeze whenever '
+                + 'a "rebuild" line is read from standard input, reusing '
+                + 'the imported application.')
 
 def main(
     module_name, dest_path, prefix, extra_pages, config_file, config_var,
-    progress, cleanup,
+    progress, cleanup, daemon,
 ):
     """
     MODULE_NAME
@@ -51,7 +78,16 @@ def main(
         )
 
     elif config_file != None:
-        config = yaml.safe_load(config_file)
+        # Read the whole file at once, so the parser gets a single
+        # contiguous buffer rather than pumping the I/O itself.
+        data = config_file.read()
+        # A document that starts as a sequence can't be a dictionary;
+        # reject it before paying the cost of parsing it.
+        if starts_with_non_mapping(data):
+            raise SyntaxError(
+                    f'File {config_file.name} is not a YAML dictionary.'
+                    )
+        config = yaml.load(data, Loader=SafeLoader)
         if not isinstance(config, dict):
             raise SyntaxError(
                     f'File {config_file.name} is not a YAML dictionary.'
@@ -101,6 +137,28 @@ def main(
         module_name, default_variable_name='app',
     )
 
+    success = run_freeze(app, config)
+
+    if daemon:
+        # Keep the process (and the imported application) alive, so
+        # repeated rebuilds don't pay the application import cost
+        # again. A "rebuild" line on standard input re-runs the
+        # freeze; "quit" or end of input stops the daemon.
+        for line in sys.stdin:
+            command = line.strip().lower()
+            if command == 'rebuild':
+                success = run_freeze(app, config)
+            elif command == 'quit':
+                break
+            elif command:
+                click.echo(f'Unknown command: {command}', file=sys.stderr)
+
+    if not success:
+        exit(1)
+
+
+def run_freeze(app, config):
+    """Freeze the app, reporting any errors. Return True on success."""
     try:
         freeze(app, config)
     except MultiError as multierr:
@@ -121,4 +179,5 @@ def main(
             click.echo(f'  in {path}', file=sys.stderr)
             for reason in task.reasons:
                 click.echo(f'    {reason}', file=sys.stderr)
-        exit(1)
+        return False
+    return True
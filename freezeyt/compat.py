@@ -46,6 +46,19 @@ def get_running_loop():
         return get_loop()
 
 
+if hasattr(str, 'isascii'):
+    str_isascii = str.isascii
+else:
+    # Python 3.6
+    def str_isascii(s):
+        """str.isascii for Python 3.6"""
+        try:
+            s.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        return True
+
+
 # In Python 3.11, freezeyt's MultiError derives from ExceptionGroup
 # and can be used with the `except*` statement.
 # In older versions, it derives from Exception instead.
@@ -29,5 +29,19 @@ class DictSaver(Saver):
             target = target.setdefault(part, {})
         return BytesIO(target[parts[-1]])
 
+    async def copy_filename(self, from_filename, to_filename):
+        # The saved content is an immutable bytes object, so the copy
+        # can share it: no bytes are moved at all.
+        from_parts = PurePosixPath(from_filename).parts
+        source = self.contents
+        for part in from_parts[:-1]:
+            source = source.setdefault(part, {})
+
+        to_parts = PurePosixPath(to_filename).parts
+        target = self.contents
+        for part in to_parts[:-1]:
+            target = target.setdefault(part, {})
+        target[to_parts[-1]] = source[from_parts[-1]]
+
     async def finish(self, success, cleanup):
         return self.contents
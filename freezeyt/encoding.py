@@ -1,5 +1,7 @@
 from urllib.parse import unquote
 
+from freezeyt.compat import str_isascii
+
 # See doc/encoding-notes.txt for notes on the string encodings.
 
 def decode_input_path(s):
@@ -16,6 +18,10 @@ def decode_input_path(s):
 def encode_wsgi_path(s):
     """Encodes an URL path from internal format for use in WSGI"""
 
+    if str_isascii(s):
+        # ASCII paths (the common case) survive the round-trip below
+        # unchanged, so skip the two string copies.
+        return s
     bytestring = s.encode('utf-8', errors='surrogateescape')
     return bytestring.decode('latin-1')
 
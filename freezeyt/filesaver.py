@@ -1,3 +1,4 @@
+import os
 import shutil
 
 from . import compat
@@ -8,6 +9,20 @@ class DirectoryExistsError(Exception):
     """Attempt to overwrite directory that doesn't contain freezeyt output"""
 
 
+def fast_copy(source, destination):
+    """Copy a file, avoiding moving its bytes around where possible.
+
+    A hard link is just a new directory entry, so try that first;
+    fall back to shutil.copyfile (which uses os.sendfile on Linux)
+    when linking isn't possible, e.g. on Windows without privileges.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
 class FileSaver(Saver):
     """Outputs frozen pages as files on the filesystem.
 
@@ -18,11 +33,23 @@ class FileSaver(Saver):
     def __init__(self, base_path, prefix):
         self.base_path = base_path.resolve()
         self.prefix = prefix
+        # Directories known to exist, so sibling files don't repeat
+        # the mkdir syscalls of the whole parent chain.
+        self._created_dirs = set()
 
     async def prepare(self):
         if self.base_path.exists():
-            has_files = list(self.base_path.iterdir())
-            has_index = self.base_path.joinpath('index.html').exists()
+            # Scan the directory once, checking both for existing files
+            # and for index.html, rather than listing it and then
+            # stat()-ing index.html separately.
+            has_files = False
+            has_index = False
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    has_files = True
+                    if entry.name == 'index.html':
+                        has_index = True
+                        break
             if has_files and not has_index:
                 raise DirectoryExistsError(
                     f'Will not overwrite directory {self.base_path}: it '
@@ -38,7 +65,11 @@ class FileSaver(Saver):
 
         loop = compat.get_running_loop()
 
-        absolute_filename.parent.mkdir(parents=True, exist_ok=True)
+        parent = absolute_filename.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+            self._created_dirs.update(parent.parents)
         with open(absolute_filename, "wb") as f:
             for item in content_iterable:
                 await loop.run_in_executor(None, f.write, item)
@@ -49,6 +80,14 @@ class FileSaver(Saver):
 
         return open(absolute_filename, 'rb')
 
+    async def copy_filename(self, from_filename, to_filename):
+        source = self.base_path / from_filename
+        destination = self.base_path / to_filename
+        assert self.base_path in destination.parents
+
+        loop = compat.get_running_loop()
+        await loop.run_in_executor(None, fast_copy, source, destination)
+
     async def finish(self, success: bool, cleanup: bool):
         """Delete incomplete directory after a failed freeze.
         """
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path, PurePosixPath
 from mimetypes import guess_type
@@ -29,6 +30,7 @@ from freezeyt.util import InfiniteRedirection, ExternalURLError
 from freezeyt.util import WrongMimetypeError, UnexpectedStatus
 from freezeyt.util import UnsupportedSchemeError, MultiError
 from freezeyt.compat import asyncio_run, asyncio_create_task
+from freezeyt.compat import get_running_loop
 from freezeyt import hooks
 from freezeyt.saver import Saver
 
@@ -155,6 +157,32 @@ def convert_mime_db(mime_db: Mapping) -> Dict[str, List[str]]:
     return converted_db
 
 
+# Converted mime-db files, keyed by filename, with the modification
+# time they were read at. Freezes are often repeated with the same
+# configuration (dev loops, CI); re-parsing the large JSON database
+# each time would dominate the setup cost.
+_mime_db_cache: Dict[str, tuple] = {}
+
+
+def load_mime_db(mime_db_file: str) -> Dict[str, List[str]]:
+    """Load and convert a mime-db file, caching the converted result.
+
+    The cache entry is invalidated when the file's modification time
+    changes.
+    """
+    mtime = os.stat(mime_db_file).st_mtime_ns
+    cached = _mime_db_cache.get(mime_db_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(mime_db_file) as file:
+        mime_db = json.load(file)
+
+    converted_db = convert_mime_db(mime_db)
+    _mime_db_cache[mime_db_file] = (mtime, converted_db)
+    return converted_db
+
+
 def default_url_to_path(path: str) -> str:
     if path.endswith('/') or not path:
         path = path + 'index.html'
@@ -200,7 +228,11 @@ class Task:
     response_headers: Optional[Headers] = None
     response_status: Optional[str] = None
     redirects_to: "Optional[Task]" = None
-    reasons: set = dataclasses.field(default_factory=set)
+    # Reasons are appended as they come, duplicates included; hashing
+    # every (often long) reason string into a set on each link would
+    # cost more than deduplicating once when the reasons are read
+    # (see TaskInfo.reasons).
+    reasons: list = dataclasses.field(default_factory=list)
     asyncio_task: "Optional[asyncio.Task]" = None
 
     def __repr__(self):
@@ -257,10 +289,7 @@ class Freezer:
             setattr(self, attr_name, config.get(attr_name, default))
 
         if self.mime_db_file:
-            with open(self.mime_db_file) as file:
-                mime_db = json.load(file)
-
-            mime_db = convert_mime_db(mime_db)
+            mime_db = load_mime_db(self.mime_db_file)
             self.get_mimetype = functools.partial(mime_db_mimetype, mime_db)
 
         if isinstance(self.get_mimetype, str):
@@ -293,6 +322,21 @@ class Freezer:
                     + f'digit and "xx", got f{key!r}'
                 )
 
+        # Expand the handlers into a per-status dispatch table, so
+        # start_response resolves a handler with a single dict lookup
+        # rather than trying the exact code and the 'Nxx' fallback
+        # separately for every response. Like the key regex, the
+        # table covers all three-digit statuses - including the
+        # zero-padded '000' to '099', which the regex also accepts.
+        self._status_handler_table = {}
+        for code in range(1000):
+            key = format(code, '03d')
+            handler = self.status_handlers.get(key)
+            if handler is None:
+                handler = self.status_handlers.get(key[0] + 'xx')
+            if handler is not None:
+                self._status_handler_table[key] = handler
+
         prefix = config.get('prefix', 'http://localhost:8000/')
 
         # Decode path in the prefix URL.
@@ -303,6 +347,27 @@ class Freezer:
             raise ValueError('prefix must end with /')
         self.prefix = prefix_parsed.replace(path=decoded_path)
 
+        # The parts of the WSGI environ that are the same for every
+        # request. Werkzeug's URL.ascii_host property re-does IDNA
+        # encoding on each access, so compute these once per freeze;
+        # handle_one_task copies this and adds the per-request values.
+        self._environ_base = {
+            'SERVER_NAME': self.prefix.ascii_host,
+            'SERVER_PORT': str(self.prefix.port),
+            'REQUEST_METHOD': 'GET',
+            'SCRIPT_NAME': encode_wsgi_path(self.prefix.path),
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'SERVER_SOFTWARE': f'freezeyt/{freezeyt.__version__}',
+
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': self.prefix.scheme,
+            'wsgi.multithread': False,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+
+            'freezeyt.freezing': True,
+        }
+
         output = config['output']
         if isinstance(output, str):
             output = {'type': 'dir', 'dir': output}
@@ -331,10 +396,23 @@ class Freezer:
             TaskStatus.IN_PROGRESS: self.inprogress_tasks,
             TaskStatus.FAILED: self.failed_tasks,
         }
+        # All tasks, regardless of status. Tasks move between the
+        # queues above, but stay registered here, so _add_task can
+        # find an existing task with one lookup instead of checking
+        # every queue.
+        self._tasks_by_path: Dict[PurePosixPath, Task] = {}
+
+        # Cache for get_path_from_url results. The same URL is
+        # typically linked from many pages; resolving it to a path
+        # (which calls the configurable url_to_path) only once makes
+        # repeated links a dict lookup.
+        self._url_to_path_cache: Dict[URL, PurePosixPath] = {}
 
         try:
             self.add_task(prefix_parsed, reason='site root (homepage)')
             self._add_extra_files()
+            self._extra_pages_prefix = prefix
+            self._extra_page_generators: List = []
             self._add_extra_pages(prefix, self.extra_pages)
 
             self.hooks = {}
@@ -395,6 +473,27 @@ class Freezer:
             task.asyncio_task = asyncio_create_task(coroutine, name=task.path)
         return task
 
+    def add_file_task(
+        self, url: URL, disk_path: Path, *, external_ok: bool = False,
+        reason: str = None,
+    ) -> Optional[Task]:
+        """Add a task to save the content of the given file at the given URL.
+
+        The file is read inside the task, in a thread pool, so reads of
+        many files can overlap with each other and with freezing.
+
+        If no task is added (e.g. for external URLs), return None.
+        """
+        # The read is deferred, but a missing source file is a
+        # configuration error: check for it now, so it is raised
+        # before the saver touches the output directory.
+        os.stat(disk_path)
+        task = self._add_task(url, external_ok=external_ok, reason=reason)
+        if task and task.asyncio_task is None:
+            coroutine = self.handle_file_task(task, disk_path)
+            task.asyncio_task = asyncio_create_task(coroutine, name=task.path)
+        return task
+
     def add_task(
         self, url: URL, *, external_ok: bool = False, reason: str = None,
     ) -> Optional[Task]:
@@ -416,21 +515,21 @@ class Freezer:
                 return None
             raise ExternalURLError(f'Unexpected external URL: {url}')
 
-        path = get_path_from_url(self.prefix, url, self.url_to_path)
-
-        for queue in self.task_queues.values():
-            if path in queue:
-                task = queue[path]
-                task.urls.add(url)
-                break
+        try:
+            path = self._url_to_path_cache[url]
+        except KeyError:
+            path = get_path_from_url(self.prefix, url, self.url_to_path)
+            self._url_to_path_cache[url] = path
+
+        task = self._tasks_by_path.get(path)
+        if task is not None:
+            task.urls.add(url)
         else:
-            # The `else` branch is entered if the loop ended normally
-            # (not with `break`, or exception, return, etc.)
-            # Here, this means the task wasn't found.
             task = Task(path, {url}, self)
             self.inprogress_tasks[path] = task
+            self._tasks_by_path[path] = task
         if reason:
-            task.reasons.add(reason)
+            task.reasons.append(reason)
         return task
 
     def _add_extra_files(self):
@@ -460,15 +559,29 @@ class Freezer:
 
     def freeze_extra_files_from_path(self, url_path, disk_path):
         if disk_path.is_dir():
-            for subpath in disk_path.iterdir():
-                self.freeze_extra_files_from_path(
-                    url_path / subpath.name, subpath)
+            # Use os.scandir rather than Path.iterdir: the is_dir()
+            # of a DirEntry is usually cached by the OS, so this avoids
+            # an extra stat() call for each file. (Symlinks are
+            # followed, as Path.is_dir would do; only they need an
+            # extra stat.)
+            with os.scandir(disk_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        self.freeze_extra_files_from_path(
+                            url_path / entry.name, Path(entry.path))
+                    else:
+                        url = self.prefix.join(str(url_path / entry.name))
+                        self.add_file_task(
+                            url=url,
+                            reason="from extra_files",
+                            disk_path=Path(entry.path),
+                        )
         else:
             url = self.prefix.join(str(url_path))
-            self.add_static_task(
+            self.add_file_task(
                 url=url,
                 reason="from extra_files",
-                content=disk_path.read_bytes(),
+                disk_path=disk_path,
             )
 
 
@@ -498,11 +611,8 @@ class Freezer:
             if value is not None:
                 raise value
 
-        if self.status_handlers.get(status[:3]):
-            status_handler = self.status_handlers.get(status[:3])
-        elif self.status_handlers.get(status[0] + 'xx'):
-            status_handler = self.status_handlers.get(status[0] + 'xx')
-        else:
+        status_handler = self._status_handler_table.get(status[:3])
+        if status_handler is None:
             raise UnexpectedStatus(url, status)
 
         task.response_headers = Headers(headers)
@@ -528,7 +638,11 @@ class Freezer:
     def _add_extra_pages(self, prefix, extras):
         """Add URLs of extra pages from config.
 
-        Handles both literal URLs and generators.
+        Literal URLs are added (and validated) immediately, so typos
+        in the configuration surface before the saver touches the
+        output directory. Generators are only collected here; they
+        are consumed in handle_urls, overlapped with the freezing
+        itself.
         """
         for extra in extras:
             if isinstance(extra, dict):
@@ -541,7 +655,7 @@ class Freezer:
                     )
                 if isinstance(generator, str):
                     generator = import_variable_from_module(generator)
-                self._add_extra_pages(prefix, generator(self.app))
+                self._extra_page_generators.append(generator)
             elif isinstance(extra, str):
                 url = parse_absolute_url(urljoin(prefix, decode_input_path(extra)))
                 try:
@@ -552,10 +666,25 @@ class Freezer:
                 except ExternalURLError:
                     raise ExternalURLError(f'External URL specified in extra_pages: {url}')
             else:
-                generator = extra
-                self._add_extra_pages(prefix, generator(self.app))
+                self._extra_page_generators.append(extra)
+
+    async def _add_generated_extra_pages(self):
+        """Consume the generators collected from extra_pages.
+
+        Yields to the event loop after each added page, so tasks that
+        were already added can be worked on while a generator is
+        still producing URLs. Consuming a generator may discover
+        nested generators; those are collected and consumed as well.
+        """
+        generators = self._extra_page_generators
+        while generators:
+            generator = generators.pop()
+            for extra in generator(self.app):
+                self._add_extra_pages(self._extra_pages_prefix, [extra])
+                await asyncio.sleep(0)
 
     async def handle_urls(self):
+        await self._add_generated_extra_pages()
         while self.inprogress_tasks:
             # Get an item from self.inprogress_tasks.
             # Since this is a dict, we can't do self.inprogress_tasks[0];
@@ -580,6 +709,15 @@ class Freezer:
         self.done_tasks[task.path] = task
         self.call_hook('page_frozen', hooks.TaskInfo(task))
 
+    @needs_semaphore
+    async def handle_file_task(self, task, disk_path):
+        loop = get_running_loop()
+        content = await loop.run_in_executor(None, disk_path.read_bytes)
+        await self.saver.save_to_filename(task.path, [content])
+        del self.inprogress_tasks[task.path]
+        self.done_tasks[task.path] = task
+        self.call_hook('page_frozen', hooks.TaskInfo(task))
+
     @needs_semaphore
     async def handle_one_task(self, task):
         # Get an URL from the task's set of URLs
@@ -594,25 +732,14 @@ class Freezer:
         if path_info.startswith(self.prefix.path):
             path_info = "/" + path_info[len(self.prefix.path):]
 
-        environ = {
-            'SERVER_NAME': self.prefix.ascii_host,
-            'SERVER_PORT': str(self.prefix.port),
-            'REQUEST_METHOD': 'GET',
-            'PATH_INFO': encode_wsgi_path(path_info),
-            'SCRIPT_NAME': encode_wsgi_path(self.prefix.path),
-            'SERVER_PROTOCOL': 'HTTP/1.1',
-            'SERVER_SOFTWARE': f'freezeyt/{freezeyt.__version__}',
-
-            'wsgi.version': (1, 0),
-            'wsgi.url_scheme': self.prefix.scheme,
-            'wsgi.input': io.BytesIO(),
-            'wsgi.errors': sys.stderr,
-            'wsgi.multithread': False,
-            'wsgi.multiprocess': False,
-            'wsgi.run_once': False,
-
-            'freezeyt.freezing': True,
-        }
+        environ = dict(
+            self._environ_base,
+            **{
+                'PATH_INFO': encode_wsgi_path(path_info),
+                'wsgi.input': io.BytesIO(),
+                'wsgi.errors': sys.stderr,
+            },
+        )
 
         # The WSGI application can output data in two ways:
         # - by a "write" function, which, in our case, will append
@@ -702,19 +829,24 @@ class Freezer:
         while self.redirecting_tasks:
             saved_something = False
             for key, task in list(self.redirecting_tasks.items()):
-                if task.redirects_to.status == TaskStatus.FAILED:
+                # Bind the status once: the property scans the task
+                # queues on every access.
+                target_status = task.redirects_to.status
+                if target_status == TaskStatus.FAILED:
                     # Don't process redirects to a failed pages
                     del self.redirecting_tasks[key]
                     self.done_tasks[task.path] = task
                     continue
-                if task.redirects_to.status != TaskStatus.DONE:
+                if target_status != TaskStatus.DONE:
                     continue
 
-                with await self.saver.open_filename(task.redirects_to.path) as f:
-                    await self.saver.save_to_filename(task.path, f)
-                self.call_hook('page_frozen', hooks.TaskInfo(task))
+                await self.saver.copy_filename(task.redirects_to.path, task.path)
                 del self.redirecting_tasks[key]
                 self.done_tasks[task.path] = task
+                # Call the hook after the task is moved to done_tasks,
+                # like handle_one_task does, so hooks see the task
+                # counted as done.
+                self.call_hook('page_frozen', hooks.TaskInfo(task))
                 saved_something = True
             if not saved_something:
                 # Get some task (the first one we get by iteration) for the
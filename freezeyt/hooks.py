@@ -34,12 +34,18 @@ class TaskInfo:
 
         New entries may be added as the freezing goes on.
         """
-        return sorted(self._task.reasons)
+        return sorted(set(self._task.reasons))
 
 
 class FreezeInfo:
     def __init__(self, freezer):
         self._freezer = freezer
+        # Import TaskStatus here to avoid a circular import
+        # (since freezer imports hooks). Doing it once per FreezeInfo
+        # keeps it off the per-page hook path: the task counts below
+        # are read by progress plugins for every frozen page.
+        from freezeyt.freezer import TaskStatus
+        self._task_status = TaskStatus
 
     def add_url(self, url, reason=None):
         self._freezer.add_task(parse_absolute_url(url), reason=reason)
@@ -53,16 +59,11 @@ class FreezeInfo:
 
     @property
     def done_task_count(self):
-        # Import TaskStatus here to avoid a circular import
-        # (since freezer imports hooks)
-        from freezeyt.freezer import TaskStatus
         return (
-            len(self._freezer.task_queues[TaskStatus.FAILED])
-            + len(self._freezer.task_queues[TaskStatus.DONE])
+            len(self._freezer.task_queues[self._task_status.FAILED])
+            + len(self._freezer.task_queues[self._task_status.DONE])
         )
 
     @property
     def failed_task_count(self):
-        # Import TaskStatus here, see done_task_count
-        from freezeyt.freezer import TaskStatus
-        return len(self._freezer.task_queues[TaskStatus.FAILED])
+        return len(self._freezer.task_queues[self._task_status.FAILED])
@@ -1,11 +1,16 @@
 import traceback
 import sys
+import time
 
 import enlighten
 import click
 
 bar_format = '{percentage:3.0f}%▕{bar}▏{elapsed}, {rate:.2f} pg/s'
 
+# Minimum time between two redraws of the progress bar, in seconds.
+# Redrawing on every frozen page would block the freeze on terminal I/O.
+MIN_REDRAW_INTERVAL = 0.1
+
 class ProgressBarPlugin:
     def __init__(self, freeze_info):
         self.manager = enlighten.get_manager()
@@ -13,6 +18,7 @@ class ProgressBarPlugin:
             total=100, color='red', bar_format=bar_format)
         self.failure_counter = self.counter
         self.success_counter = self.counter.add_subcounter('cyan')
+        self.last_redraw = 0.0
         freeze_info.add_hook('page_frozen', self.update_bar)
         freeze_info.add_hook('page_failed', self.update_bar)
 
@@ -23,20 +29,34 @@ class ProgressBarPlugin:
             task_info.freeze_info.done_task_count
             - task_info.freeze_info.failed_task_count
         )
-        self.counter.update(0)
+        # Keep the counts above up to date on every page, but redraw
+        # the bar at most a few times per second (and when all tasks
+        # are done, so the final state is always shown).
+        now = time.monotonic()
+        if (
+            now - self.last_redraw >= MIN_REDRAW_INTERVAL
+            or self.counter.count == self.counter.total
+        ):
+            self.last_redraw = now
+            self.counter.update(0)
 
 class LogPlugin:
     def __init__(self, freeze_info):
         freeze_info.add_hook('page_frozen', self.page_frozen)
         freeze_info.add_hook('page_failed', self.page_failed)
+        self.total_width = 1
 
     def _summary(self, freeze_info):
         total = freeze_info.total_task_count
         failed = freeze_info.failed_task_count
         done = freeze_info.done_task_count
         progress = done / total
+        # Cache the field width for the "done" count; recompute it
+        # only when the total outgrows the cached width.
+        if total >= 10 ** self.total_width:
+            self.total_width = len(str(total))
         result = [
-            f'[{done:{len(str(total))}d}/{total}, ~{progress:3.0%}'
+            f'[{done:{self.total_width}d}/{total}, ~{progress:3.0%}'
         ]
         if failed:
             result.append(f', {failed} errors')
@@ -21,6 +21,19 @@ class Saver(abc.ABC):
     ) -> BinaryIO:
         """Open the given path for reading bytes"""
 
+    async def copy_filename(
+        self,
+        from_filename: PurePosixPath,
+        to_filename: PurePosixPath,
+    ) -> None:
+        """Copy content saved at one path to another path.
+
+        Savers may override this with a faster way of copying than
+        reading the content back and saving it again.
+        """
+        with await self.open_filename(from_filename) as f:
+            await self.save_to_filename(to_filename, f)
+
     async def finish(self, success: bool, cleanup: bool) -> Any:
         """Clean up after a freeze and return the result, if any.
 
@@ -84,6 +84,14 @@ def is_external(parsed_url, prefix):
         raise ValueError('prefix must end with /')
     if prefix_path == '/':
         prefix_path = ''
+    if (
+        parsed_url.scheme == prefix.scheme
+        and parsed_url.netloc == prefix.netloc
+    ):
+        # Fast path: equal netloc strings mean equal host and port,
+        # without Werkzeug's ascii_host property re-doing IDNA
+        # encoding for every checked URL.
+        return not parsed_url.path.startswith(prefix_path)
     return (
         parsed_url.scheme != prefix.scheme
         or parsed_url.ascii_host != prefix.ascii_host
@@ -147,6 +147,28 @@ def test_nonstandard_dotted_app_name(tmp_path):
     )
 
 
+def test_cli_daemon_mode_rebuilds(tmp_path):
+    app_name = 'app_simple'
+    app_dir = FIXTURES_PATH / app_name
+    build_dir = tmp_path / 'build'
+    expected = app_dir / 'test_expected_output'
+
+    runner = CliRunner(env={'PYTHONPATH': str(app_dir)})
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.syspath_prepend(app_dir)
+        result = runner.invoke(
+            main, ['app', str(build_dir), '--daemon'],
+            input='rebuild\nquit\n',
+        )
+
+    if result.exception is not None:
+        raise result.exception
+    assert result.exit_code == 0
+
+    assert_dirs_same(build_dir, expected)
+
+
 def test_cleanup_config_works_if_runs_from_cli(tmp_path):
     app_name = 'app_cleanup_config'
     build_dir = tmp_path / 'build'
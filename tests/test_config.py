@@ -112,6 +112,27 @@ def test_no_output_dir(tmp_path):
             freeze(module.app, freeze_config)
 
 
+def test_missing_extra_file_copy_from(tmp_path):
+    output_dir = tmp_path / 'output'
+    output_dir.mkdir()
+    (output_dir / 'index.html').write_text('old build')
+
+    with context_for_test('app_2pages') as module:
+        freeze_config = {
+            'output': str(output_dir),
+            'extra_files': {
+                'extra.dat': {'copy_from': str(tmp_path / 'does_not_exist')},
+            },
+        }
+
+        with pytest.raises(FileNotFoundError):
+            freeze(module.app, freeze_config)
+
+    # The error was raised before the saver touched the directory,
+    # so the previous build is still there.
+    assert (output_dir / 'index.html').read_text() == 'old build'
+
+
 def test_external_extra_files(tmp_path):
     with context_for_test('app_2pages') as module:
         freeze_config = {